@@ -1,12 +1,12 @@
 """Adoption Data module."""
 
 from functools import lru_cache
-import pathlib
 import re
 
 from model import interpolation
 from model import dd
 from model.metaclass_cache import MetaclassCache
+from model import sourcedata
 import numpy as np
 import pandas as pd
 
@@ -29,6 +29,7 @@ class AdoptionData(object, metaclass=MetaclassCache):
                and rows for each region:
                'World', 'OECD90', 'Eastern Europe', 'Asia (Sans Japan)', 'Middle East and Africa',
                'Latin America', 'China', 'India', 'EU', 'USA'
+               A dict of {region: {param: value}} may be passed instead of the dataframe.
              main_includes_regional: boolean of whether the global min/max/sd should include
                data from the primary regions.
         """
@@ -54,16 +55,12 @@ class AdoptionData(object, metaclass=MetaclassCache):
             df = pd.DataFrame()
             df.name = 'forecast_data_' + self._name_to_identifier(region)
             df_per_region[region] = df
+        sourcedata.prefetch(sourcedata.source_filenames(self.data_sources), 0)
         for (groupname, group) in self.data_sources.items():
             for (name, value) in group.items():
-                if (isinstance(value, str) or isinstance(value, pathlib.Path) or
-                        isinstance(value, pathlib.PurePath)):
-                    sources = {name: value}
-                else:
-                    sources = value
+                sources = {name: value} if sourcedata.is_path(value) else value
                 for name, filename in sources.items():
-                    df = pd.read_csv(filename, header=0, index_col=0, skipinitialspace=True,
-                            skip_blank_lines=True, comment='#')
+                    df = sourcedata.read_csv(str(filename), 0)
                     for region in dd.REGIONS:
                         df_per_region[region].loc[:, name] = df.loc[:, region]
         self._adoption_data = df_per_region
@@ -122,9 +119,9 @@ class AdoptionData(object, metaclass=MetaclassCache):
                 # if there is only a single source, Excel uses it directly without taking a Mean.
                 medium = adoption_data.loc[:, columns[0]]
             result.loc[:, 'Medium'] = medium
-            result.loc[:, 'Low'] = medium - (min_max_sd.loc[:, 'S.D'] * adconfig.loc['low_sd_mult'])
+            result.loc[:, 'Low'] = medium - (min_max_sd.loc[:, 'S.D'] * adconfig['low_sd_mult'])
             result.loc[:, 'High'] = medium + (
-                min_max_sd.loc[:, 'S.D'] * adconfig.loc['high_sd_mult'])
+                min_max_sd.loc[:, 'S.D'] * adconfig['high_sd_mult'])
         return result
 
 
@@ -288,11 +285,11 @@ class AdoptionData(object, metaclass=MetaclassCache):
         """
         main_region = dd.REGIONS[0]  # first columns, ex: 'World'
         if not trend:
-            trend = self.adconfig.loc['trend', region]
+            trend = self.adconfig[region]['trend']
         if region == main_region:
             growth = self.ac.soln_pds_adoption_prognostication_growth
         else:
-            growth = self.adconfig.loc['growth', region]
+            growth = self.adconfig[region]['growth']
         result = self._adoption_trend(self.adoption_low_med_high(region), growth, trend)
         result.name = 'adoption_trend_' + self._name_to_identifier(region) + '_' + str(trend).lower()
         return result
@@ -2,11 +2,13 @@
    but can be overridden to fit particular needs.
 """
 
+import collections.abc
 import dataclasses
 import enum
 import glob
 import json
 import os
+import sys
 import typing
 
 import pandas as pd
@@ -956,20 +958,69 @@ def fill_missing_regions_from_world(data):
         return data
 
 
+def _scenario_from_json(filename, j, vmas):
+    """Construct AdvancedControls from the parsed contents j of JSON file filename."""
+    js = j.copy()
+    js['vmas'] = vmas
+    js['js'] = j
+    js['jsfile'] = str(filename)
+    return AdvancedControls(**js)
+
+
 def load_scenarios_from_json(directory, vmas):
     """Load scenarios from JSON files in directory."""
     result = {}
     for filename in glob.glob(str(directory.joinpath('*.json'))):
         with open(filename, 'r') as fid:
             j = json.loads(fid.read())
-            js = j.copy()
-            js['vmas'] = vmas
-            js['js'] = j
-            js['jsfile'] = str(filename)
-            a = AdvancedControls(**js)
+            a = _scenario_from_json(filename, j, vmas)
             result[a.name] = a
     return result
 
+
+class LazyScenarios(collections.abc.Mapping):
+    """Scenarios from JSON files in directory, keyed by scenario name.
+
+       Behaves like the dict returned by load_scenarios_from_json, in the same order,
+       but only the JSON is parsed up front. Each AdvancedControls is constructed the
+       first time its scenario is looked up and then reused. Most list and dict values,
+       like costs and per-region adoption, are identical across the scenarios of a
+       solution; equal values share one object, which must be treated as read-only.
+       String values are interned for the same reason.
+    """
+    def __init__(self, directory, vmas):
+        self.vmas = vmas
+        self._json = {}
+        shared = {}
+        for filename in glob.glob(str(directory.joinpath('*.json'))):
+            with open(filename, 'r') as fid:
+                j = json.loads(fid.read())
+            for (field, value) in j.items():
+                if isinstance(value, str):
+                    j[field] = sys.intern(value)
+                elif isinstance(value, (list, dict)):
+                    # key order matters: dicts like ref_base_adoption are read positionally.
+                    key = json.dumps(value)
+                    j[field] = shared.setdefault(key, value)
+            self._json[j.get('name')] = (filename, j)
+        self._scenarios = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._scenarios[name]
+        except KeyError:
+            (filename, j) = self._json[name]
+            a = _scenario_from_json(filename, j, self.vmas)
+            self._scenarios[name] = a
+            return a
+
+    def __iter__(self):
+        return iter(self._json)
+
+    def __len__(self):
+        return len(self._json)
+
+
 def get_vma_for_param(param):
     for field in dataclasses.fields(AdvancedControls):
         if field.name == param:
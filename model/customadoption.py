@@ -10,6 +10,18 @@ pd.set_option('display.expand_frame_repr', False)
 YEARS = list(range(2012, 2061))
 
 
+@lru_cache(maxsize=None)
+def _read_csv_cached(filename):
+    """Parse and check a custom adoption CSV once per process. The result must not be modified."""
+    df = pd.read_csv(filename, header=0, index_col=0, skipinitialspace=True,
+                     skip_blank_lines=True, comment='#', dtype=np.float64, memory_map=True)
+    df.index = df.index.astype(int)
+    df.index.name = 'Year'
+    assert list(df.columns) == dd.REGIONS, f"unknown columns: {list(df.columns)}"
+    assert list(df.index) == YEARS, f"unknown index: {list(df.index)}"
+    return df
+
+
 def generate_df_template():
     """ Returns DataFrame to be populated by adoption data """
     df = pd.DataFrame(index=YEARS, columns=dd.REGIONS, dtype=np.float64)
@@ -94,14 +106,11 @@ class CustomAdoption(object, metaclass=MetaclassCache):
 
 
     def _read_csv(self, filename):
-        """Read in a CSV file from filename."""
-        df = pd.read_csv(filename, header=0, index_col=0, skipinitialspace=True,
-                         skip_blank_lines=True, comment='#', dtype=np.float64)
-        df.index = df.index.astype(int)
-        df.index.name = 'Year'
-        assert list(df.columns) == dd.REGIONS, f"unknown columns: {list(df.columns)}"
-        assert list(df.index) == YEARS, f"unknown index: {list(df.index)}"
-        return df
+        """Read in a CSV file from filename.
+
+           Solutions may adjust the returned data in place, so each call gets its own copy.
+        """
+        return _read_csv_cached(str(filename)).copy()
 
 
     def _linear_forecast(self, datapoints, start_year, end_year):
@@ -4,8 +4,8 @@ Conversions and lookups useful in converting to CO2 equivalents,
 and other factors relating to emissions and pollutants.
 """
 
-from functools import lru_cache
 import enum
+import numpy as np
 import pandas as pd
 
 CO2EQ_SOURCE = enum.Enum('CO2EQ_SOURCE', 'AR5_WITH_FEEDBACK AR4 SAR')
@@ -22,36 +22,54 @@ class CO2Equiv:
        AR4: as used in the IPCC 4th Assessment Report.
        SAR: as used in the IPCC Second Assessment Report.
     """
+    # (CH4multiplier, N2Omultiplier) for each conversion source.
+    _MULTIPLIERS = {
+        CO2EQ_SOURCE.AR5_WITH_FEEDBACK: (34, 298),
+        CO2EQ_SOURCE.AR4: (25, 298),
+        CO2EQ_SOURCE.SAR: (21, 310),
+    }
+
     def __init__(self, conversion_source=None):
         self.conversion_source = conversion_source if conversion_source else CO2EQ_SOURCE.AR5_WITH_FEEDBACK
-        if self.conversion_source == CO2EQ_SOURCE.AR5_WITH_FEEDBACK:
-            self.CH4multiplier = 34
-            self.N2Omultiplier = 298
-        elif self.conversion_source == CO2EQ_SOURCE.AR4:
-            self.CH4multiplier = 25
-            self.N2Omultiplier = 298
-        elif self.conversion_source == CO2EQ_SOURCE.SAR:
-            self.CH4multiplier = 21
-            self.N2Omultiplier = 310
-        else:
+        try:
+            self.CH4multiplier, self.N2Omultiplier = self._MULTIPLIERS[self.conversion_source]
+        except KeyError:
             raise ValueError("invalid conversion_source=" + str(self.conversion_source))
 
 
+_CONVERSION_SOURCES = {
+    "ar5 with feedback": CO2EQ_SOURCE.AR5_WITH_FEEDBACK,
+    "ar5_with_feedback": CO2EQ_SOURCE.AR5_WITH_FEEDBACK,
+    "ar4": CO2EQ_SOURCE.AR4,
+    "sar": CO2EQ_SOURCE.SAR,
+}
+
+_GRID_SOURCES = {
+    "meta-analysis": GRID_SOURCE.META,
+    "meta_analysis": GRID_SOURCE.META,
+    "meta analysis": GRID_SOURCE.META,
+    "ipcc only": GRID_SOURCE.IPCC,
+    "ipcc_only": GRID_SOURCE.IPCC,
+}
+
+_GRID_RANGES = {
+    "mean": GRID_RANGE.MEAN,
+    "median": GRID_RANGE.MEAN,
+    "high": GRID_RANGE.HIGH,
+    "low": GRID_RANGE.LOW,
+}
+
+
 def string_to_conversion_source(text):
     """Convert the text strings passed from the Excel implementation of the models
        to the enumerated type defined in this module.
        "Advanced Controls"!I185
     """
-    if str(text).lower() == "ar5 with feedback":
-        return CO2EQ_SOURCE.AR5_WITH_FEEDBACK
-    elif str(text).lower() == "ar5_with_feedback":
-        return CO2EQ_SOURCE.AR5_WITH_FEEDBACK
-    elif str(text).lower() == "ar4":
-        return CO2EQ_SOURCE.AR4
-    elif str(text).lower() == "sar":
-        return CO2EQ_SOURCE.SAR
-    else:
-        raise ValueError("invalid conversion name=" + str(text))
+    name = str(text)
+    try:
+        return _CONVERSION_SOURCES[name.lower()]
+    except KeyError:
+        raise ValueError("invalid conversion name=" + name)
 
 
 def string_to_emissions_grid_source(text):
@@ -59,18 +77,11 @@ def string_to_emissions_grid_source(text):
        to the enumerated type defined in this module.
        "Advanced Controls"!C189
     """
-    if str(text).lower() == "meta-analysis":
-        return GRID_SOURCE.META
-    elif str(text).lower() == "meta_analysis":
-        return GRID_SOURCE.META
-    elif str(text).lower() == "meta analysis":
-        return GRID_SOURCE.META
-    elif str(text).lower() == "ipcc only":
-        return GRID_SOURCE.IPCC
-    elif str(text).lower() == "ipcc_only":
-        return GRID_SOURCE.IPCC
-    else:
-        raise ValueError("invalid grid source name=" + str(text))
+    name = str(text)
+    try:
+        return _GRID_SOURCES[name.lower()]
+    except KeyError:
+        raise ValueError("invalid grid source name=" + name)
 
 
 def string_to_emissions_grid_range(text):
@@ -78,16 +89,11 @@ def string_to_emissions_grid_range(text):
        to the enumerated type defined in this module.
        "Advanced Controls"!D189
     """
-    if str(text).lower() == "mean":
-        return GRID_RANGE.MEAN
-    elif str(text).lower() == "median":
-        return GRID_RANGE.MEAN
-    elif str(text).lower() == "high":
-        return GRID_RANGE.HIGH
-    elif str(text).lower() == "low":
-        return GRID_RANGE.LOW
-    else:
-        raise ValueError("invalid grid range name=" + str(text))
+    name = str(text)
+    try:
+        return _GRID_RANGES[name.lower()]
+    except KeyError:
+        raise ValueError("invalid grid range name=" + name)
 
 
 class ElectricityGenOnGrid:
@@ -95,76 +101,130 @@ class ElectricityGenOnGrid:
         self.ac = ac
         self.grid_emissions_version = grid_emissions_version
 
-    @lru_cache()
-    def conv_ref_grid_CO2eq_per_KWh(self):
+    def conv_ref_grid_CO2eq_per_KWh(self, copy=False):
         """Grid emission factors (kg CO2-eq per kwh) derived from the AMPERE 3
            MESSAGE Base model. Grid emission factors are fixed at 2015 levels
            to reflect the REF case (e.g. no significant technological change).
 
+           The returned DataFrame is read-only and shared with every other caller
+           using the same grid source, range and version. Pass copy=True to get
+           a private, writable copy.
+
            'Emissions Factors'!A11:K57
         """
-        result = pd.DataFrame(index=list(range(2015, 2061)),
-                              columns=["World", "OECD90", "Eastern Europe", "Asia (Sans Japan)",
-                                       "Middle East and Africa", "Latin America", "China", "India",
-                                       "EU", "USA"])
-        result.index.name = "Year"
-        if self.ac.emissions_grid_source == GRID_SOURCE.IPCC:
-            grid = _world_ipcc
-        elif self.ac.emissions_grid_source == GRID_SOURCE.META and self.grid_emissions_version == 1:
-            grid = _world_meta_1
-        elif self.ac.emissions_grid_source == GRID_SOURCE.META and self.grid_emissions_version == 2:
-            grid = _world_meta_2
-
-        if self.ac.emissions_grid_range == GRID_RANGE.HIGH:
-            result.loc[:, "World"] = grid.loc[:, "high"].values
-        elif self.ac.emissions_grid_range == GRID_RANGE.LOW:
-            result.loc[:, "World"] = grid.loc[:, "low"].values
-        elif self.ac.emissions_grid_range == GRID_RANGE.MEAN:
-            result.loc[:, "World"] = grid.loc[:, "medium"].values
-        else:
-            raise ValueError(f"Invalid ac.emissions_grid_range {self.ac.emissions_grid_range}")
-
-        # Generation mixes from the AMPERE/MESSAGE WG3 BAU scenario, direct and
-        # indirect emission factors by fuel from the IPCC WG3 Annex III Table A.III.2
-        # https://www.ipcc.ch/pdf/assessment-report/ar5/wg3/ipcc_wg3_ar5_annex-iii.pdf
-        result.loc[:, "OECD90"] = 0.454068989
-        result.loc[:, "Eastern Europe"] = 0.724747956
-        result.loc[:, "Asia (Sans Japan)"] = 0.457658947
-        result.loc[:, "Middle East and Africa"] = 0.282243907
-        result.loc[:, "Latin America"] = 0.564394712
-        result.loc[:, "China"] = 0.535962403
-        result.loc[:, "India"] = 0.787832379
-        result.loc[:, "EU"] = 0.360629290
-        result.loc[:, "USA"] = 0.665071666
-        return result
-
-
-    @lru_cache()
-    def conv_ref_grid_CO2_per_KWh(self):
+        key = (self.ac.emissions_grid_source, self.ac.emissions_grid_range,
+               self.grid_emissions_version)
+        try:
+            result = _GRID_CO2EQ_CACHE[key]
+        except KeyError:
+            raise ValueError(f"Invalid (emissions_grid_source, emissions_grid_range, "
+                             f"grid_emissions_version) {key}")
+        return result.copy() if copy else result
+
+    def conv_ref_grid_CO2_per_KWh(self, copy=False):
         """Generation mixes from the AMPERE/MESSAGE WG3 BAU scenario, direct emission
            factors by fuel from the IPCC WG3 Annex III Table A.III.2.
+
+           The returned DataFrame is read-only and shared; pass copy=True to get
+           a private, writable copy.
+
            "Emissions Factors"!A66:K112
         """
-        result = pd.DataFrame(index=list(range(2015, 2061)),
-                              columns=["World", "OECD90", "Eastern Europe", "Asia (Sans Japan)",
-                                       "Middle East and Africa", "Latin America", "China", "India",
-                                       "EU", "USA"])
-        result.index.name = "Year"
-        result.loc[:, "World"] = 0.484512031078339
-        result.loc[:, "OECD90"] = 0.392126590013504
-        result.loc[:, "Eastern Europe"] = 0.659977316856384
-        result.loc[:, "Asia (Sans Japan)"] = 0.385555833578110
-        result.loc[:, "Middle East and Africa"] = 0.185499981045723
-        result.loc[:, "Latin America"] = 0.491537630558014
-        result.loc[:, "China"] = 0.474730312824249
-        result.loc[:, "India"] = 0.725081980228424
-        result.loc[:, "EU"] = 0.297016531229019
-        result.loc[:, "USA"] = 0.594563066959381
-        return result
+        return _GRID_CO2_TABLE.copy() if copy else _GRID_CO2_TABLE
+
+
+# Generation mixes from the AMPERE/MESSAGE WG3 BAU scenario, direct and
+# indirect emission factors by fuel from the IPCC WG3 Annex III Table A.III.2
+# https://www.ipcc.ch/pdf/assessment-report/ar5/wg3/ipcc_wg3_ar5_annex-iii.pdf
+_REGION_CONSTANTS_EQ = {
+    "OECD90": 0.454068989,
+    "Eastern Europe": 0.724747956,
+    "Asia (Sans Japan)": 0.457658947,
+    "Middle East and Africa": 0.282243907,
+    "Latin America": 0.564394712,
+    "China": 0.535962403,
+    "India": 0.787832379,
+    "EU": 0.360629290,
+    "USA": 0.665071666,
+}
+
+# "Emissions Factors"!A66:K112
+_REGION_CONSTANTS_CO2 = {
+    "World": 0.484512031078339,
+    "OECD90": 0.392126590013504,
+    "Eastern Europe": 0.659977316856384,
+    "Asia (Sans Japan)": 0.385555833578110,
+    "Middle East and Africa": 0.185499981045723,
+    "Latin America": 0.491537630558014,
+    "China": 0.474730312824249,
+    "India": 0.725081980228424,
+    "EU": 0.297016531229019,
+    "USA": 0.594563066959381,
+}
+
+# Column labels shared by every grid table.
+_GRID_COLUMNS = pd.Index(["World", *_REGION_CONSTANTS_EQ])
+assert list(_GRID_COLUMNS) == list(_REGION_CONSTANTS_CO2)
+
+# Years covered by every grid table, and the column of each grid range in the
+# _world_* tables below.
+_YEARS = pd.RangeIndex(2015, 2061, name="Year")
+_WORLD_COLUMNS = {GRID_RANGE.MEAN: 0, GRID_RANGE.HIGH: 1, GRID_RANGE.LOW: 2}
+
+
+def build_all_grid_frames():
+    """Grid emission factor tables for every (grid source, grid range, emissions version).
+
+       Returns a dict keyed by (GRID_SOURCE, GRID_RANGE, grid_emissions_version) whose
+       values are the same shared, read-only DataFrames returned by
+       ElectricityGenOnGrid.conv_ref_grid_CO2eq_per_KWh(), for use in sweeps across
+       emissions grid settings.
+    """
+    return dict(_GRID_CO2EQ_CACHE)
+
+
+def _build_all_grid_CO2eq_per_KWh():
+    """Construct the 'Emissions Factors'!A11:K57 table for every combination of
+       grid source, grid range and emissions version.
+
+       All of the tables are slices of one contiguous float64 array.
+    """
+    keys = [(source, rng, version) for source in GRID_SOURCE
+            for rng in GRID_RANGE for version in (1, 2)]
+    values = np.empty((len(keys), len(_YEARS), 1 + len(_REGION_CONSTANTS_EQ)), dtype=np.float64)
+    # the region constants are broadcast down every year of every table.
+    values[:, :, 1:] = np.fromiter(_REGION_CONSTANTS_EQ.values(), dtype=np.float64)
+    for i, (grid_source, grid_range, grid_emissions_version) in enumerate(keys):
+        grid = _WORLD_TABLES[(grid_source, grid_emissions_version)]
+        values[i, :, 0] = grid[:, _WORLD_COLUMNS[grid_range]]
+    values.setflags(write=False)
+    return {key: pd.DataFrame(values[i], index=_YEARS, columns=_GRID_COLUMNS)
+            for i, key in enumerate(keys)}
+
+
+def _build_grid_CO2_per_KWh():
+    """Construct the "Emissions Factors"!A66:K112 table."""
+    values = np.empty((len(_YEARS), len(_REGION_CONSTANTS_CO2)), dtype=np.float64)
+    values[:] = np.fromiter(_REGION_CONSTANTS_CO2.values(), dtype=np.float64)
+    values.setflags(write=False)
+    result = pd.DataFrame(values, index=_YEARS, columns=_GRID_COLUMNS)
+    return result
+
+
+# The _world_* tables are transcribed with columns (Year, medium, high, low). Once loaded
+# the Year column is checked against _YEARS and dropped, leaving a contiguous float64
+# (medium, high, low) array which is marked read-only so that column slices can be shared
+# with callers without a defensive copy.
+def _split_years(table):
+    """Drop the Year column from a (Year, medium, high, low) table."""
+    assert np.array_equal(table[:, 0], _YEARS), f"unexpected years: {table[:, 0]}"
+    values = np.ascontiguousarray(table[:, 1:])
+    values.setflags(write=False)
+    return values
 
 
 # "Emissions Factors"!A290:D336
-_world_meta_1 = pd.DataFrame([
+_world_meta_1 = np.array([
     [2015, 0.580491641, 0.726805942, 0.444419682], [2016, 0.580381730, 0.726494196, 0.444511607],
     [2017, 0.580191808, 0.726117383, 0.444508574], [2018, 0.579932742, 0.725684840, 0.444422987],
     [2019, 0.579613986, 0.725204693, 0.444265621], [2020, 0.581083120, 0.726403172, 0.446005409],
@@ -188,10 +248,10 @@ _world_meta_1 = pd.DataFrame([
     [2055, 0.560917031, 0.703992021, 0.428084382], [2056, 0.560611819, 0.703651663, 0.427814318],
     [2057, 0.560332776, 0.703337903, 0.427569991], [2058, 0.560081211, 0.703051332, 0.427353431],
     [2059, 0.559858464, 0.702793863, 0.427165406], [2060, 0.559324305, 0.702254712, 0.426636240]],
-    columns=['Year', 'medium', 'high', 'low'])
+    dtype=np.float64)
 
 # "Emissions Factors"!F290:I336
-_world_ipcc = pd.DataFrame([
+_world_ipcc = np.array([
     [2015, 0.484233480, 0.954301231, 0.415714612], [2016, 0.483874688, 0.953705809, 0.415699168],
     [2017, 0.483468578, 0.953091500, 0.415616211], [2018, 0.483022234, 0.952462141, 0.415474740],
     [2019, 0.482541828, 0.951821094, 0.415282576], [2020, 0.483415642, 0.952177536, 0.416520905],
@@ -215,10 +275,10 @@ _world_ipcc = pd.DataFrame([
     [2055, 0.463546558, 0.932020796, 0.401594807], [2056, 0.463244299, 0.931712734, 0.401369308],
     [2057, 0.462964542, 0.931424470, 0.401164041], [2058, 0.462707434, 0.931155097, 0.400980276],
     [2059, 0.462474856, 0.930907038, 0.400818857], [2060, 0.462020537, 0.930512637, 0.400404559]],
-    columns=['Year', 'medium', 'high', 'low'])
+    dtype=np.float64)
 
 # "Emissions Factors"!A290:D336 in the 2020 version of the Excel files.
-_world_meta_2 = pd.DataFrame([
+_world_meta_2 = np.array([
     [2015, 0.619753649484954, 0.834200994227942, 0.446911398737087],
     [2016, 0.613223327855322, 0.827419241197181, 0.441324423346894],
     [2017, 0.606715005275064, 0.817903147977287, 0.436594799095373],
@@ -265,4 +325,21 @@ _world_meta_2 = pd.DataFrame([
     [2058, 0.490979702541600, 0.697825838098367, 0.337199902765339],
     [2059, 0.488840556318235, 0.695672846558836, 0.335358807437345],
     [2060, 0.486810301162345, 0.693612676011530, 0.333607332510495]],
-    columns=['Year', 'medium', 'high', 'low'])
+    dtype=np.float64)
+
+_world_meta_1 = _split_years(_world_meta_1)
+_world_meta_2 = _split_years(_world_meta_2)
+_world_ipcc = _split_years(_world_ipcc)
+
+# Both versions of the Excel files use the same IPCC table.
+_WORLD_TABLES = {
+    (GRID_SOURCE.META, 1): _world_meta_1,
+    (GRID_SOURCE.META, 2): _world_meta_2,
+    (GRID_SOURCE.IPCC, 1): _world_ipcc,
+    (GRID_SOURCE.IPCC, 2): _world_ipcc,
+}
+
+# The grid tables depend only on (grid source, grid range, emissions version), so every
+# combination is built once at import and shared, read-only, by all callers.
+_GRID_CO2EQ_CACHE = _build_all_grid_CO2eq_per_KWh()
+_GRID_CO2_TABLE = _build_grid_CO2_per_KWh()
@@ -0,0 +1,68 @@
+"""Reading of the data source CSVs shared by the TAM and Adoption Data modules."""
+
+import concurrent.futures
+from functools import lru_cache
+import pathlib
+
+from model import dd
+import numpy as np
+import pandas as pd
+
+# Data source columns are all numeric; declaring that up front skips type inference.
+_REGION_DTYPES = {region: np.float64 for region in dd.REGIONS}
+_COLUMNS = frozenset(["Year"] + dd.REGIONS)
+
+# (filename, index_col) of every file read_csv has parsed, so prefetch can skip them. An
+# entry left stale by read_csv.cache_clear() only means that file is parsed serially.
+_parsed = set()
+
+
+def is_path(value):
+    """True if value is the filename of one data source, not a dict of sources."""
+    return isinstance(value, (str, pathlib.PurePath))
+
+
+def source_filenames(data_sources):
+    """Filenames of all sources in a {group: {name: filename or {name: filename}}} dict."""
+    for group in data_sources.values():
+        for value in group.values():
+            if is_path(value):
+                yield value
+            else:
+                yield from value.values()
+
+
+@lru_cache(maxsize=None)
+def read_csv(filename, index_col):
+    """Parse the Year and region columns of a data source CSV.
+
+       The same files are listed for many regions and solutions, so each is parsed once
+       per process, keeping every region the file has; other columns are not read.
+
+       Results are cached on (filename, index_col), so pass both positionally. The
+       returned DataFrame is shared by all callers and its values are read-only;
+       callers which need to modify it must take a copy.
+    """
+    df = pd.read_csv(filename, header=0, index_col=index_col, skipinitialspace=True,
+            skip_blank_lines=True, comment='#', dtype=_REGION_DTYPES, memory_map=True,
+            usecols=lambda column: column in _COLUMNS)
+    values = df.to_numpy(dtype=np.float64, copy=True)
+    values.setflags(write=False)
+    _parsed.add((filename, index_col))
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+def prefetch(filenames, index_col):
+    """Fill the read_csv cache for filenames, parsing files not yet read concurrently.
+
+       pandas' C parser releases the GIL, so on a cold start the files are parsed in
+       parallel. Files already cached are skipped, and no thread pool is started unless
+       at least two distinct files remain to be parsed.
+    """
+    pending = [f for f in dict.fromkeys(str(f) for f in filenames)
+            if (f, index_col) not in _parsed]
+    if len(pending) == 1:
+        read_csv(pending[0], index_col)
+    elif pending:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            list(executor.map(read_csv, pending, [index_col] * len(pending)))
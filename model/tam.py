@@ -1,15 +1,17 @@
 """Total Addressable Market module."""
 
 from functools import lru_cache
-import pathlib
+import itertools
 import re
 
 from model import dd
 from model.metaclass_cache import MetaclassCache
 from model import interpolation
+from model import sourcedata
 import numpy as np
 import pandas as pd
 
+
 class TAM(object, metaclass=MetaclassCache):
     """Total Addressable Market module."""
 
@@ -23,6 +25,7 @@ class TAM(object, metaclass=MetaclassCache):
               and rows for each region:
               'World', 'OECD90', 'Eastern Europe', 'Asia (Sans Japan)', 'Middle East and Africa',
               'Latin America', 'China', 'India', 'EU', 'USA'
+             A dict of {region: {param: value}} may be passed instead of the dataframe.
            tam_ref_data_sources: a dict() of group names which contain dicts of data source names.
              Used for Total Addressable Market and adoption calculations in the REF scenario.
              For example:
@@ -47,10 +50,6 @@ class TAM(object, metaclass=MetaclassCache):
         x = re.sub(r"[()]", "", name.lower())
         return re.sub(r" ", "_", x)
 
-    def _is_path(self, value):
-        return (isinstance(value, str) or isinstance(value, pathlib.Path) or
-                isinstance(value, pathlib.PurePath))
-
     def _populate_forecast_data(self):
         """Read data files in self.tam_*_data_sources to populate forecast data."""
         df_per_region = {}
@@ -61,24 +60,25 @@ class TAM(object, metaclass=MetaclassCache):
             df.name = 'forecast_data_' + self._name_to_identifier(region)
             df_per_region[region] = df
 
+        sourcedata.prefetch(itertools.chain(sourcedata.source_filenames(self.tam_ref_data_sources),
+                sourcedata.source_filenames(self.tam_pds_data_sources)), 'Year')
+
         for (groupname, group) in self.tam_ref_data_sources.items():
             regions = dd.REGIONS if not groupname.startswith("Region: ") else [groupname.replace("Region: ", "")]
             for (name, value) in group.items():
-                sources = {name: value} if self._is_path(value) else value
+                sources = {name: value} if sourcedata.is_path(value) else value
 
                 for name, filename in sources.items():
-                    df = pd.read_csv(filename, header=0, index_col="Year", skipinitialspace=True,
-                            skip_blank_lines=True, comment='#', usecols=["Year"] + regions)
+                    df = sourcedata.read_csv(str(filename), 'Year')
                     for region in regions:
                         df_per_region[region][name] = df[region]
 
         for (groupname, group) in self.tam_pds_data_sources.items():
             for (name, value) in group.items():
-                sources = {name: value} if self._is_path(value) else value
+                sources = {name: value} if sourcedata.is_path(value) else value
 
                 for name, filename in sources.items():
-                    df = pd.read_csv(filename, header=0, index_col="Year", skipinitialspace=True,
-                            skip_blank_lines=True, comment='#', usecols=["Year", main_region])
+                    df = sourcedata.read_csv(str(filename), 'Year')
                     df_per_region[main_region_pds][name] = df[main_region]
 
         self._forecast_data = df_per_region
@@ -399,7 +399,7 @@ class TAM(object, metaclass=MetaclassCache):
         else:
             data_sources = self._get_data_sources(
                     data_sources=self.tam_ref_data_sources, region=region)
-        growth = self.tamconfig.loc['growth', region]
+        growth = self.tamconfig[region]['growth']
         trend = self._get_trend(trend=trend, tamconfig=self.tamconfig[region],
                 data_sources=data_sources)
         data = self.forecast_low_med_high(region).loc[:, growth]
@@ -448,7 +448,7 @@ class TAM(object, metaclass=MetaclassCache):
                 region_pds = 'PDS ' + region
                 result[region] = self.forecast_trend(region_pds).loc[:, 'adoption']
                 lmh = self.forecast_low_med_high(region)
-                growth = self.tamconfig.loc['growth', region_pds]
+                growth = self.tamconfig[region_pds]['growth']
                 first_year = result.first_valid_index()
                 result.loc[first_year, region] = lmh.loc[first_year, 'Medium']
             else:
@@ -321,6 +321,41 @@ def test_from_json():
     assert ac.conv_first_cost_efficiency_rate == pytest.approx(5.0)
 
 
+def test_lazy_from_json():
+    l = advanced_controls.LazyScenarios(directory=datadir.joinpath('ac'), vmas=None)
+    assert len(l) == 1
+    assert list(l.keys()) == ['ac_dataclass']
+    assert not l._scenarios
+    ac = l['ac_dataclass']
+    assert ac.pds_2014_cost == pytest.approx(1.0)
+    assert ac.conv_first_cost_efficiency_rate == pytest.approx(5.0)
+    assert l['ac_dataclass'] is ac
+    with pytest.raises(KeyError):
+        l['no such scenario']
+
+
+def test_lazy_from_json_shares_equal_values():
+    final_pct = [['World', 0.0], ['OECD90', 0.0]]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = pathlib.Path(tmpdir)
+        for (name, base) in [('s1', {'World': 1.0}), ('s2', {'World': 1.0}), ('s3', {'World': 2.0}),
+                ('s4', {'World': 1.0, 'OECD90': 2.0}), ('s5', {'OECD90': 2.0, 'World': 1.0})]:
+            with open(directory.joinpath(name + '.json'), 'w') as fid:
+                json.dump({'name': name, 'ref_base_adoption': base,
+                    'pds_adoption_final_percentage': final_pct,
+                    'source_until_2014': 'ALL SOURCES',
+                    'pds_2014_cost': {'value': 1.0, 'statistic': ''}}, fid)
+        l = advanced_controls.LazyScenarios(directory=directory, vmas=None)
+        assert l['s1'].ref_base_adoption is l['s2'].ref_base_adoption
+        assert l['s3'].ref_base_adoption == {'World': 2.0}
+        assert l['s1'].pds_adoption_final_percentage is l['s3'].pds_adoption_final_percentage
+        assert l['s1'].pds_adoption_final_percentage == final_pct
+        assert l['s1'].source_until_2014 is l['s3'].source_until_2014
+        assert l['s1'].js['pds_2014_cost'] is l['s2'].js['pds_2014_cost']
+        assert list(l['s4'].ref_base_adoption) == ['World', 'OECD90']
+        assert list(l['s5'].ref_base_adoption) == ['OECD90', 'World']
+
+
 def test_to_json():
     (f, jsfile) = tempfile.mkstemp()
     ac = advanced_controls.AdvancedControls(
@@ -22,6 +22,20 @@ def test_scenarios():
     assert len(ca.scenarios) == 2
 
 
+def test_scenarios_do_not_share_data():
+    data_sources = [
+        {'name': 'scenario 1', 'filename': path1, 'include': True},
+    ]
+    # distinct soln_adoption_custom_name so MetaclassCache does not hand out other tests' objects
+    ca1 = customadoption.CustomAdoption(data_sources=data_sources, soln_adoption_custom_name='copy1')
+    ca2 = customadoption.CustomAdoption(data_sources=data_sources, soln_adoption_custom_name='copy2')
+    df1 = ca1.scenarios['scenario 1']['df']
+    df2 = ca2.scenarios['scenario 1']['df']
+    pd.testing.assert_frame_equal(df1, df2)
+    df1.loc[2012, 'World'] = -1.0
+    assert df2.loc[2012, 'World'] != -1.0
+
+
 def test_bad_CSV_file():
     path1 = str(datadir.joinpath('ca_scenario_no_world_trr.csv'))
     data_sources = [
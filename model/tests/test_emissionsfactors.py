@@ -15,6 +15,10 @@ def test_CO2Equiv():
     c = ef.CO2Equiv(ef.CO2EQ_SOURCE.SAR)
     assert c.CH4multiplier == 21
     assert c.N2Omultiplier == 310
+    with pytest.raises(ValueError):
+        ef.CO2Equiv("invalid")
+    with pytest.raises(ValueError):
+        ef.CO2Equiv(ef.GRID_SOURCE.IPCC)
 
 
 def test_string_to_conversion_source():
@@ -47,6 +51,18 @@ def test_string_to_emissions_grid_range():
         ef.string_to_emissions_grid_range("invalid")
 
 
+def test_string_to_enums_require_exact_names():
+    for text in ["ar5", "ar4 with feedback", "sarah"]:
+        with pytest.raises(ValueError):
+            ef.string_to_conversion_source(text)
+    for text in ["meta", "ipcc", "metadata"]:
+        with pytest.raises(ValueError):
+            ef.string_to_emissions_grid_source(text)
+    for text in ["highest", "lower", "med"]:
+        with pytest.raises(ValueError):
+            ef.string_to_emissions_grid_range(text)
+
+
 def test_ElectricityGenOnGrid_conv_ref_grid_CO2eq_per_KWh():
     ac = advanced_controls.AdvancedControls(
             emissions_grid_source="ipcc_only", emissions_grid_range="mean")
@@ -97,6 +113,69 @@ def test_ElectricityGenOnGrid_conv_ref_grid_CO2eq_per_KWh_invalid_range():
         _ = eg.conv_ref_grid_CO2eq_per_KWh()
 
 
+def test_ElectricityGenOnGrid_tables_are_float64():
+    for source in ef.GRID_SOURCE:
+        for rng in ef.GRID_RANGE:
+            for version in (1, 2):
+                ac = advanced_controls.AdvancedControls(
+                        emissions_grid_source=source, emissions_grid_range=rng)
+                eg = ef.ElectricityGenOnGrid(ac=ac, grid_emissions_version=version)
+                table = eg.conv_ref_grid_CO2eq_per_KWh()
+                assert table.shape == (46, 10)
+                assert (table.dtypes == 'float64').all()
+    table = ef.ElectricityGenOnGrid(ac=None).conv_ref_grid_CO2_per_KWh()
+    assert table.shape == (46, 10)
+    assert (table.dtypes == 'float64').all()
+
+
+def test_ElectricityGenOnGrid_tables_shared():
+    ac = advanced_controls.AdvancedControls(
+            emissions_grid_source="meta-analysis", emissions_grid_range="mean")
+    eg1 = ef.ElectricityGenOnGrid(ac=ac)
+    eg2 = ef.ElectricityGenOnGrid(ac=ac)
+    table = eg1.conv_ref_grid_CO2eq_per_KWh()
+    assert table is eg2.conv_ref_grid_CO2eq_per_KWh()
+    with pytest.raises(ValueError):
+        table.loc[2020, 'World'] = 0.0
+    copied = eg1.conv_ref_grid_CO2eq_per_KWh(copy=True)
+    assert copied is not table
+    copied.loc[2020, 'World'] = 0.0
+    assert table.loc[2020, 'World'] == pytest.approx(0.581083120)
+    table = eg1.conv_ref_grid_CO2_per_KWh()
+    assert table is eg2.conv_ref_grid_CO2_per_KWh()
+    copied = eg1.conv_ref_grid_CO2_per_KWh(copy=True)
+    copied.loc[2020, 'World'] = 0.0
+    assert table.loc[2020, 'World'] == pytest.approx(0.484512031)
+
+
+def test_build_all_grid_frames():
+    frames = ef.build_all_grid_frames()
+    assert len(frames) == 12
+    table = frames[(ef.GRID_SOURCE.IPCC, ef.GRID_RANGE.HIGH, 1)]
+    assert table.loc[2020, 'World'] == pytest.approx(0.952177536)
+    assert table.loc[2025, "OECD90"] == pytest.approx(0.454068989)
+    table = frames[(ef.GRID_SOURCE.META, ef.GRID_RANGE.LOW, 2)]
+    assert table.loc[2015, 'World'] == pytest.approx(0.446911398737087)
+    ac = advanced_controls.AdvancedControls(
+            emissions_grid_source="meta-analysis", emissions_grid_range="low")
+    eg = ef.ElectricityGenOnGrid(ac=ac, grid_emissions_version=2)
+    assert eg.conv_ref_grid_CO2eq_per_KWh() is table
+
+
+def test_ElectricityGenOnGrid_invalid_version():
+    ac = advanced_controls.AdvancedControls(
+            emissions_grid_source="meta-analysis", emissions_grid_range="mean")
+    eg = ef.ElectricityGenOnGrid(ac=ac, grid_emissions_version=3)
+    with pytest.raises(ValueError, match=r"GRID_SOURCE.META.*GRID_RANGE.MEAN.*, 3\)"):
+        eg.conv_ref_grid_CO2eq_per_KWh()
+
+
+def test_world_grid_tables_read_only():
+    for table in ef._WORLD_TABLES.values():
+        with pytest.raises(ValueError):
+            table[0, 0] = 0.0
+
+
 def test_conv_ref_grid_CO2_per_KWh():
     eg = ef.ElectricityGenOnGrid(ac=None)
     table = eg.conv_ref_grid_CO2_per_KWh()
@@ -0,0 +1,75 @@
+"""Tests for sourcedata.py."""
+
+import concurrent.futures
+import pathlib
+import tempfile
+import numpy as np
+import pytest
+from model import dd
+from model import sourcedata
+
+
+basedir = pathlib.Path(__file__).parents[2]
+datadir = pathlib.Path(__file__).parents[0].joinpath('data')
+
+
+def test_read_csv_parsed_once():
+    filename = str(basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'))
+    df = sourcedata.read_csv(filename, 'Year')
+    assert sourcedata.read_csv(filename, 'Year') is df
+    assert (df.dtypes == np.float64).all()
+    assert list(df.columns) == dd.REGIONS
+
+
+def test_read_csv_index_col():
+    filename = str(datadir.joinpath('ad_based_on_IEA_ETP_2016_6DS.csv'))
+    df = sourcedata.read_csv(filename, 0)
+    assert df.index.name == 'Year'
+    assert (df.dtypes == np.float64).all()
+
+
+def test_read_csv_only_region_columns():
+    f = tempfile.NamedTemporaryFile(mode='w', suffix='.csv')
+    f.write("Year,World,Notes,OECD90\n2014,1.0,from a table,2.0\n2015,3.0,,4.0\n")
+    f.flush()
+    df = sourcedata.read_csv(f.name, 'Year')
+    assert list(df.columns) == ['World', 'OECD90']
+    assert df.loc[2015, 'OECD90'] == 4.0
+
+
+def test_read_csv_read_only():
+    filename = str(basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'))
+    df = sourcedata.read_csv(filename, 'Year')
+    with pytest.raises(ValueError):
+        df.loc[2014, 'World'] = 0.0
+    copied = df.copy()
+    copied.loc[2014, 'World'] = 0.0
+
+
+def test_source_filenames():
+    data_sources = {
+        'Baseline Cases': {'A': 'a.csv', 'B': pathlib.Path('b.csv')},
+        'Region: OECD90': {'Baseline Cases': {'C': 'c.csv'}},
+    }
+    assert list(sourcedata.source_filenames(data_sources)) == [
+            'a.csv', pathlib.Path('b.csv'), 'c.csv']
+
+
+def test_prefetch():
+    filenames = [basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
+            basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv')]
+    sourcedata.prefetch(filenames + filenames, 'Year')
+    hits = sourcedata.read_csv.cache_info().hits
+    for filename in filenames:
+        sourcedata.read_csv(str(filename), 'Year')
+    assert sourcedata.read_csv.cache_info().hits == hits + 2
+
+
+def test_prefetch_cached_files_skip_pool(monkeypatch):
+    filenames = [basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
+            basedir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv')]
+    sourcedata.prefetch(filenames, 'Year')
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool started for cached files")
+    monkeypatch.setattr(concurrent.futures, 'ThreadPoolExecutor', no_pool)
+    sourcedata.prefetch(filenames, 'Year')
@@ -625,6 +625,17 @@ def test_pds_tam_per_region():
     pd.testing.assert_frame_equal(result, expected, check_exact=False)
 
 
+def test_tamconfig_dict():
+    tamconfig = g_tamconfig.to_dict()
+    tm = tam.TAM(tamconfig=tamconfig, tam_ref_data_sources=g_tam_ref_data_sources,
+                 tam_pds_data_sources=g_tam_pds_data_sources)
+    result = tm.pds_tam_per_region()
+    filename = datadir.joinpath('pds_tam_per_region.csv')
+    expected = pd.read_csv(filename, header=0, index_col=0,
+                           skipinitialspace=True, comment='#')
+    pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+
 def test_pds_tam_per_region_no_pds_sources():
     no_data_sources = {'Ambitious Cases': {}, 'Baseline Cases': {},
                        'Conservative Cases': {}}
@@ -2,7 +2,9 @@
    Excel filename: Nuclear_RRS_ELECGEN_v1.1b_18Jan2020.xlsm
 """
 
+import functools
 import pathlib
+import sys
 
 import numpy as np
 import pandas as pd
@@ -109,6 +111,243 @@ VMAs = {
 }
 vma.populate_fixed_summaries(vma_dict=VMAs, filename=THISDIR.joinpath('vma_data', 'VMA_info.csv'))
 
+# Adoption data sources, by display name and CSV file stem in ad/.
+_AD_SOURCES = {
+    'Based on BP Energy Outlook 2019 (Evolving transition Scenario)': 'BP_Energy_Outlook_2019_Evolving_transition_Scenario',
+    'Based on IEEJ Outlook - 2019, Ref Scenario': 'IEEJ_Outlook_2019_Ref_Scenario',
+    'Based on IEA, WEO-2018, Current Policies Scenario (CPS)': 'IEA_WEO2018_Current_Policies_Scenario_CPS',
+    'Based on: IEA ETP 2017 Ref Tech': 'IEA_ETP_2017_Ref_Tech',
+    'Based on Equinor (2018), Reform Scenario': 'Equinor_2018_Reform_Scenario',
+    'Based on IEA, WEO-2018, New Policies Scenario (NPS)': 'IEA_WEO2018_New_Policies_Scenario_NPS',
+    'Based on Equinor (2018), Renewal Scenario': 'Equinor_2018_Renewal_Scenario',
+    'Based on IEEJ Outlook - 2019, Advanced Tech Scenario': 'IEEJ_Outlook_2019_Advanced_Tech_Scenario',
+    'Based on: Grantham Institute and Carbon Tracker (2017), Strong Scenario, Original, Medium': 'Grantham_Institute_and_Carbon_Tracker_2017_Strong_Scenario_Original_Medium',
+    'Based on IEA, WEO-2018, SDS Scenario': 'IEA_WEO2018_SDS_Scenario',
+    'Based on: IEA ETP 2017 B2DS': 'IEA_ETP_2017_B2DS',
+    'Based on: IEA ETP 2017 2DS': 'IEA_ETP_2017_2DS',
+    'Based on average of: LUT/EWG 2019 100% RES, Ecofys 2018 1.5C and Greenpeace 2015 Advanced Revolution': 'average_of_LUTEWG_2019_100_RES_Ecofys_2018_1_5C_and_Greenpeace_2015_Advanced_Revolution',
+    'Based on: AMPERE 2014 MESSAGE MACRO Reference': 'AMPERE_2014_MESSAGE_MACRO_Reference',
+    'Based on: AMPERE 2014 IMAGE TIMER Reference': 'AMPERE_2014_IMAGE_TIMER_Reference',
+    'Based on: AMPERE 2014 MESSAGE MACRO 550': 'AMPERE_2014_MESSAGE_MACRO_550',
+    'Based on: AMPERE 2014 GEM E3 550': 'AMPERE_2014_GEM_E3_550',
+    'Based on: AMPERE 2014 IMAGE TIMER 550': 'AMPERE_2014_IMAGE_TIMER_550',
+    'Based on: AMPERE 2014 MESSAGE MACRO 450': 'AMPERE_2014_MESSAGE_MACRO_450',
+    'Based on: AMPERE 2014 GEM E3 450': 'AMPERE_2014_GEM_E3_450',
+    'Based on: AMPERE 2014 IMAGE TIMER 450': 'AMPERE_2014_IMAGE_TIMER_450',
+    'Based on: AMPERE 2014 GEM E3 Reference': 'AMPERE_2014_GEM_E3_Reference',
+    'Based on: IEA ETP 2016 4DS': 'IEA_ETP_2016_4DS',
+    'Based on: IEA ETP 2016 2DS': 'IEA_ETP_2016_2DS',
+}
+_AD_PATHS = {name: THISDIR.joinpath('ad', f'ad_based_on_{stem}.csv')
+    for (name, stem) in _AD_SOURCES.items()}
+
+# Which sources are listed in each case group, globally and per region.
+_AD_SCHEMA = {
+    'Baseline Cases': [
+        'Based on BP Energy Outlook 2019 (Evolving transition Scenario)',
+        'Based on IEEJ Outlook - 2019, Ref Scenario',
+        'Based on IEA, WEO-2018, Current Policies Scenario (CPS)',
+        'Based on: IEA ETP 2017 Ref Tech',
+    ],
+    'Conservative Cases': [
+        'Based on Equinor (2018), Reform Scenario',
+        'Based on IEA, WEO-2018, New Policies Scenario (NPS)',
+    ],
+    'Ambitious Cases': [
+        'Based on Equinor (2018), Renewal Scenario',
+        'Based on IEEJ Outlook - 2019, Advanced Tech Scenario',
+        'Based on: Grantham Institute and Carbon Tracker (2017), Strong Scenario, Original, Medium',
+        'Based on IEA, WEO-2018, SDS Scenario',
+        'Based on: IEA ETP 2017 B2DS',
+        'Based on: IEA ETP 2017 2DS',
+    ],
+    '100% RES2050 Case': [
+        'Based on average of: LUT/EWG 2019 100% RES, Ecofys 2018 1.5C and Greenpeace 2015 Advanced Revolution',
+    ],
+    'Region: OECD90': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: Eastern Europe': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 GEM E3 Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: Asia (Sans Japan)': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: Middle East and Africa': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: Latin America': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: China': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 GEM E3 Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: IEA ETP 2016 4DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: IEA ETP 2016 2DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: India': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 GEM E3 Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: IEA ETP 2016 4DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: IEA ETP 2016 2DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: EU': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 GEM E3 Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: IEA ETP 2016 4DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: IEA ETP 2016 2DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+    'Region: USA': {
+        'Baseline Cases': [
+            'Based on: AMPERE 2014 MESSAGE MACRO Reference',
+            'Based on: AMPERE 2014 GEM E3 Reference',
+            'Based on: AMPERE 2014 IMAGE TIMER Reference',
+        ],
+        'Conservative Cases': [
+            'Based on: IEA ETP 2016 4DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 550',
+            'Based on: AMPERE 2014 GEM E3 550',
+            'Based on: AMPERE 2014 IMAGE TIMER 550',
+        ],
+        'Ambitious Cases': [
+            'Based on: IEA ETP 2016 2DS',
+            'Based on: AMPERE 2014 MESSAGE MACRO 450',
+            'Based on: AMPERE 2014 GEM E3 450',
+            'Based on: AMPERE 2014 IMAGE TIMER 450',
+        ],
+    },
+}
+
+
+def _build_ad_data_sources(schema):
+    """Expand _AD_SCHEMA into the {group: {source name: filename}} dict AdoptionData takes.
+
+       Source names in the scenario JSON are interned when loaded, so the names here are
+       interned too and lookups against them can match by identity.
+    """
+    return {sys.intern(group): _build_ad_data_sources(value) if isinstance(value, dict)
+            else {sys.intern(name): _AD_PATHS[name] for name in value}
+            for (group, value) in schema.items()}
+
+
+ad_data_sources = _build_ad_data_sources(_AD_SCHEMA)
+
+# Adoption data config of all regions except World, which varies with the scenario.
+_ADCONFIG_REGIONAL = {region: {'trend': '3rd Poly', 'growth': 'Medium',
+    'low_sd_mult': 1.0, 'high_sd_mult': 1.0} for region in dd.REGIONS[1:]}
+
+# Custom PDS Data
+ca_pds_data_sources = [
+    {'name': 'Project Drawdown High Growth, Ambitious Cases, adjusted', 'include': True,
+        'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Project_Drawdown_High_Growth_Ambitious_Cases_adjusted.csv')},
+    {'name': 'Project Drawdown High Growth, Conservative Cases, adjusted, smoothed curve', 'include': True,
+        'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Project_Drawdown_High_Growth_Conservative_Cases_adjusted_smoothed_curve.csv')},
+    {'name': 'Optimum Nuclear reduces to 0% of TAM by 2050, based on AMPERE RefPol Scenario (2014) till peaking', 'include': True,
+        'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Optimum_Nuclear_reduces_to_0_of_TAM_by_2050_based_on_AMPERE_RefPol_Scenario_2014_till_peaking.csv')},
+]
+
+# Custom REF Data
+ca_ref_data_sources = [
+    {'name': 'Custom REF Adoption mirroring decline in nuclear in Plausible SCenario', 'include': False,
+        'filename': THISDIR.joinpath('ca_ref_data', 'custom_ref_ad_Custom_REF_Adoption_mirroring_decline_in_nuclear_in_Plausible_SCenario.csv')},
+]
+
 units = {
     "implementation unit": "TW",
     "functional unit": "TWh",
@@ -119,7 +358,13 @@ units = {
 name = 'Nuclear'
 solution_category = ac.SOLUTION_CATEGORY.REPLACEMENT
 
-scenarios = ac.load_scenarios_from_json(directory=THISDIR.joinpath('ac'), vmas=VMAs)
+scenarios = ac.LazyScenarios(directory=THISDIR.joinpath('ac'), vmas=VMAs)
+
+
+@functools.lru_cache()
+def _ht_ref_adoption_initial(ref_base_adoption):
+    """REF base adoption per region, shared by all scenarios with the same values."""
+    return pd.Series(ref_base_adoption, index=dd.REGIONS)
 
 
 class Scenario:
@@ -127,6 +372,8 @@ class Scenario:
     units = units
     vmas = VMAs
     solution_category = solution_category
+    __slots__ = ('scenario', 'ac', 'tm', '_ad', '_pds_ca', '_ref_ca', 'ht', 'ef', 'ua',
+            '_fc', '_oc', '_c4', '_c2', '_r2s')
 
     def __init__(self, scenario=None):
         if scenario is None:
@@ -151,223 +398,16 @@ class Scenario:
                 'Medium', 'Medium', 'Medium', 'Medium', 'Medium', 'Medium', 'Medium'],
             ['low_sd_mult', 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
             ['high_sd_mult', 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]]
-        tamconfig = pd.DataFrame(tamconfig_list[1:], columns=tamconfig_list[0],
-            dtype=np.object).set_index('param')
+        tamconfig = {region: {row[0]: row[col] for row in tamconfig_list[1:]}
+            for (col, region) in enumerate(tamconfig_list[0]) if col > 0}
         self.tm = tam.TAM(tamconfig=tamconfig, tam_ref_data_sources=rrs.energy_tam_2_ref_data_sources,
             tam_pds_data_sources=rrs.energy_tam_2_pds_data_sources)
         ref_tam_per_region=self.tm.ref_tam_per_region()
         pds_tam_per_region=self.tm.pds_tam_per_region()
 
-        adconfig_list = [
-            ['param', 'World', 'OECD90', 'Eastern Europe', 'Asia (Sans Japan)',
-             'Middle East and Africa', 'Latin America', 'China', 'India', 'EU', 'USA'],
-            ['trend', self.ac.soln_pds_adoption_prognostication_trend, '3rd Poly',
-             '3rd Poly', '3rd Poly', '3rd Poly', '3rd Poly', '3rd Poly',
-             '3rd Poly', '3rd Poly', '3rd Poly'],
-            ['growth', self.ac.soln_pds_adoption_prognostication_growth, 'Medium',
-             'Medium', 'Medium', 'Medium', 'Medium', 'Medium',
-             'Medium', 'Medium', 'Medium'],
-            ['low_sd_mult', 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
-            ['high_sd_mult', 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]]
-        adconfig = pd.DataFrame(adconfig_list[1:], columns=adconfig_list[0],
-            dtype=np.object).set_index('param')
-        ad_data_sources = {
-            'Baseline Cases': {
-                'Based on BP Energy Outlook 2019 (Evolving transition Scenario)': THISDIR.joinpath('ad', 'ad_based_on_BP_Energy_Outlook_2019_Evolving_transition_Scenario.csv'),
-                'Based on IEEJ Outlook - 2019, Ref Scenario': THISDIR.joinpath('ad', 'ad_based_on_IEEJ_Outlook_2019_Ref_Scenario.csv'),
-                'Based on IEA, WEO-2018, Current Policies Scenario (CPS)': THISDIR.joinpath('ad', 'ad_based_on_IEA_WEO2018_Current_Policies_Scenario_CPS.csv'),
-                'Based on: IEA ETP 2017 Ref Tech': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2017_Ref_Tech.csv'),
-            },
-            'Conservative Cases': {
-                'Based on Equinor (2018), Reform Scenario': THISDIR.joinpath('ad', 'ad_based_on_Equinor_2018_Reform_Scenario.csv'),
-                'Based on IEA, WEO-2018, New Policies Scenario (NPS)': THISDIR.joinpath('ad', 'ad_based_on_IEA_WEO2018_New_Policies_Scenario_NPS.csv'),
-            },
-            'Ambitious Cases': {
-                'Based on Equinor (2018), Renewal Scenario': THISDIR.joinpath('ad', 'ad_based_on_Equinor_2018_Renewal_Scenario.csv'),
-                'Based on IEEJ Outlook - 2019, Advanced Tech Scenario': THISDIR.joinpath('ad', 'ad_based_on_IEEJ_Outlook_2019_Advanced_Tech_Scenario.csv'),
-                'Based on: Grantham Institute and Carbon Tracker (2017), Strong Scenario, Original, Medium': THISDIR.joinpath('ad', 'ad_based_on_Grantham_Institute_and_Carbon_Tracker_2017_Strong_Scenario_Original_Medium.csv'),
-                'Based on IEA, WEO-2018, SDS Scenario': THISDIR.joinpath('ad', 'ad_based_on_IEA_WEO2018_SDS_Scenario.csv'),
-                'Based on: IEA ETP 2017 B2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2017_B2DS.csv'),
-                'Based on: IEA ETP 2017 2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2017_2DS.csv'),
-            },
-            '100% RES2050 Case': {
-                'Based on average of: LUT/EWG 2019 100% RES, Ecofys 2018 1.5C and Greenpeace 2015 Advanced Revolution': THISDIR.joinpath('ad', 'ad_based_on_average_of_LUTEWG_2019_100_RES_Ecofys_2018_1_5C_and_Greenpeace_2015_Advanced_Revolution.csv'),
-            },
-            'Region: OECD90': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: Eastern Europe': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 GEM E3 Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: Asia (Sans Japan)': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: Middle East and Africa': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: Latin America': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: China': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 GEM E3 Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: IEA ETP 2016 4DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_4DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: IEA ETP 2016 2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_2DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: India': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 GEM E3 Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: IEA ETP 2016 4DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_4DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: IEA ETP 2016 2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_2DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: EU': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 GEM E3 Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: IEA ETP 2016 4DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_4DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: IEA ETP 2016 2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_2DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-            'Region: USA': {
-                'Baseline Cases': {
-                  'Based on: AMPERE 2014 MESSAGE MACRO Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-                  'Based on: AMPERE 2014 GEM E3 Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER Reference': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-              },
-                'Conservative Cases': {
-                  'Based on: IEA ETP 2016 4DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_4DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-                  'Based on: AMPERE 2014 GEM E3 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_550.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 550': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-              },
-                'Ambitious Cases': {
-                  'Based on: IEA ETP 2016 2DS': THISDIR.joinpath('ad', 'ad_based_on_IEA_ETP_2016_2DS.csv'),
-                  'Based on: AMPERE 2014 MESSAGE MACRO 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-                  'Based on: AMPERE 2014 GEM E3 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_GEM_E3_450.csv'),
-                  'Based on: AMPERE 2014 IMAGE TIMER 450': THISDIR.joinpath('ad', 'ad_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-              },
-            },
-        }
-        self.ad = adoptiondata.AdoptionData(ac=self.ac, data_sources=ad_data_sources,
-            adconfig=adconfig)
-
-        # Custom PDS Data
-        ca_pds_data_sources = [
-            {'name': 'Project Drawdown High Growth, Ambitious Cases, adjusted', 'include': True,
-                'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Project_Drawdown_High_Growth_Ambitious_Cases_adjusted.csv')},
-            {'name': 'Project Drawdown High Growth, Conservative Cases, adjusted, smoothed curve', 'include': True,
-                'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Project_Drawdown_High_Growth_Conservative_Cases_adjusted_smoothed_curve.csv')},
-            {'name': 'Optimum Nuclear reduces to 0% of TAM by 2050, based on AMPERE RefPol Scenario (2014) till peaking', 'include': True,
-                'filename': THISDIR.joinpath('ca_pds_data', 'custom_pds_ad_Optimum_Nuclear_reduces_to_0_of_TAM_by_2050_based_on_AMPERE_RefPol_Scenario_2014_till_peaking.csv')},
-        ]
-        self.pds_ca = customadoption.CustomAdoption(data_sources=ca_pds_data_sources,
-            soln_adoption_custom_name=self.ac.soln_pds_adoption_custom_name,
-            high_sd_mult=1.0, low_sd_mult=1.0,
-            total_adoption_limit=pds_tam_per_region)
-
-        # Custom REF Data
-        ca_ref_data_sources = [
-            {'name': 'Custom REF Adoption mirroring decline in nuclear in Plausible SCenario', 'include': False,
-                'filename': THISDIR.joinpath('ca_ref_data', 'custom_ref_ad_Custom_REF_Adoption_mirroring_decline_in_nuclear_in_Plausible_SCenario.csv')},
-        ]
-        self.ref_ca = customadoption.CustomAdoption(data_sources=ca_ref_data_sources,
-            soln_adoption_custom_name=self.ac.soln_ref_adoption_custom_name,
-            high_sd_mult=1.0, low_sd_mult=1.0,
-            total_adoption_limit=ref_tam_per_region)
+        self._ad = None
+        self._pds_ca = None
+        self._ref_ca = None
 
         if self.ac.soln_ref_adoption_basis == 'Custom':
             ref_adoption_data_per_region = self.ref_ca.adoption_data_per_region()
@@ -387,18 +427,26 @@ class Scenario:
             pds_adoption_trend_per_region = self.ad.adoption_trend_per_region()
             pds_adoption_is_single_source = self.ad.adoption_is_single_source()
 
-        ht_ref_adoption_initial = pd.Series(list(self.ac.ref_base_adoption.values()), index=dd.REGIONS)
-        ht_ref_adoption_final = ref_tam_per_region.loc[2050] * (ht_ref_adoption_initial / ref_tam_per_region.loc[2014])
-        ht_ref_datapoints = pd.DataFrame(columns=dd.REGIONS)
-        ht_ref_datapoints.loc[2018] = ht_ref_adoption_initial
-        ht_ref_datapoints.loc[2050] = ht_ref_adoption_final.fillna(0.0)
+        ht_ref_adoption_initial = _ht_ref_adoption_initial(tuple(self.ac.ref_base_adoption.values()))
+        # REF and PDS TAM share one year index, so the rows are located once for both.
+        row2014 = ref_tam_per_region.index.get_loc(2014)
+        row2050 = ref_tam_per_region.index.get_loc(2050)
+        # TAM columns are always dd.REGIONS, so the arrays line up without label alignment.
+        ref_tam_values = ref_tam_per_region.values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ht_ref_adoption_final = pd.Series(ref_tam_values[row2050] *
+                (ht_ref_adoption_initial.values / ref_tam_values[row2014]),
+                index=dd.REGIONS)
+        ht_ref_datapoints = pd.DataFrame(np.vstack([ht_ref_adoption_initial.values,
+            ht_ref_adoption_final.fillna(0.0).values]), index=[2018, 2050], columns=dd.REGIONS)
         ht_pds_adoption_initial = ht_ref_adoption_initial
-        ht_regions, ht_percentages = zip(*self.ac.pds_adoption_final_percentage)
-        ht_pds_adoption_final_percentage = pd.Series(list(ht_percentages), index=list(ht_regions))
-        ht_pds_adoption_final = ht_pds_adoption_final_percentage * pds_tam_per_region.loc[2050]
-        ht_pds_datapoints = pd.DataFrame(columns=dd.REGIONS)
-        ht_pds_datapoints.loc[2014] = ht_pds_adoption_initial
-        ht_pds_datapoints.loc[2050] = ht_pds_adoption_final.fillna(0.0)
+        # Regions without a final percentage get no PDS adoption in 2050.
+        ht_pds_adoption_final_percentage = pd.Series(
+            dict(self.ac.pds_adoption_final_percentage)).reindex(dd.REGIONS).values
+        ht_pds_adoption_final = ht_pds_adoption_final_percentage * pds_tam_per_region.values[row2050]
+        ht_pds_datapoints = pd.DataFrame(np.vstack([ht_pds_adoption_initial.values,
+            np.where(np.isnan(ht_pds_adoption_final), 0.0, ht_pds_adoption_final)]),
+            index=[2014, 2050], columns=dd.REGIONS)
         self.ht = helpertables.HelperTables(ac=self.ac,
             ref_datapoints=ht_ref_datapoints, pds_datapoints=ht_pds_datapoints,
             pds_adoption_data_per_region=pds_adoption_data_per_region,
@@ -417,53 +465,122 @@ class Scenario:
             soln_ref_funits_adopted=self.ht.soln_ref_funits_adopted(),
             soln_pds_funits_adopted=self.ht.soln_pds_funits_adopted(),
             bug_cfunits_double_count=True)
-        soln_pds_tot_iunits_reqd = self.ua.soln_pds_tot_iunits_reqd()
-        soln_ref_tot_iunits_reqd = self.ua.soln_ref_tot_iunits_reqd()
-        conv_ref_tot_iunits = self.ua.conv_ref_tot_iunits()
-        soln_net_annual_funits_adopted=self.ua.soln_net_annual_funits_adopted()
-
-        self.fc = firstcost.FirstCost(ac=self.ac, pds_learning_increase_mult=2,
-            ref_learning_increase_mult=2, conv_learning_increase_mult=2,
-            soln_pds_tot_iunits_reqd=soln_pds_tot_iunits_reqd,
-            soln_ref_tot_iunits_reqd=soln_ref_tot_iunits_reqd,
-            conv_ref_tot_iunits=conv_ref_tot_iunits,
-            soln_pds_new_iunits_reqd=self.ua.soln_pds_new_iunits_reqd(),
-            soln_ref_new_iunits_reqd=self.ua.soln_ref_new_iunits_reqd(),
-            conv_ref_new_iunits=self.ua.conv_ref_new_iunits(),
-            fc_convert_iunit_factor=rrs.TERAWATT_TO_KILOWATT)
-
-        self.oc = operatingcost.OperatingCost(ac=self.ac,
-            soln_net_annual_funits_adopted=soln_net_annual_funits_adopted,
-            soln_pds_tot_iunits_reqd=soln_pds_tot_iunits_reqd,
-            soln_ref_tot_iunits_reqd=soln_ref_tot_iunits_reqd,
-            conv_ref_annual_tot_iunits=self.ua.conv_ref_annual_tot_iunits(),
-            soln_pds_annual_world_first_cost=self.fc.soln_pds_annual_world_first_cost(),
-            soln_ref_annual_world_first_cost=self.fc.soln_ref_annual_world_first_cost(),
-            conv_ref_annual_world_first_cost=self.fc.conv_ref_annual_world_first_cost(),
-            single_iunit_purchase_year=2017,
-            soln_pds_install_cost_per_iunit=self.fc.soln_pds_install_cost_per_iunit(),
-            conv_ref_install_cost_per_iunit=self.fc.conv_ref_install_cost_per_iunit(),
-            conversion_factor=rrs.TERAWATT_TO_KILOWATT)
-
-        self.c4 = ch4calcs.CH4Calcs(ac=self.ac,
-            soln_net_annual_funits_adopted=soln_net_annual_funits_adopted)
-
-        self.c2 = co2calcs.CO2Calcs(ac=self.ac,
-            ch4_ppb_calculator=self.c4.ch4_ppb_calculator(),
-            soln_pds_net_grid_electricity_units_saved=self.ua.soln_pds_net_grid_electricity_units_saved(),
-            soln_pds_net_grid_electricity_units_used=self.ua.soln_pds_net_grid_electricity_units_used(),
-            soln_pds_direct_co2_emissions_saved=self.ua.soln_pds_direct_co2_emissions_saved(),
-            soln_pds_direct_ch4_co2_emissions_saved=self.ua.soln_pds_direct_ch4_co2_emissions_saved(),
-            soln_pds_direct_n2o_co2_emissions_saved=self.ua.soln_pds_direct_n2o_co2_emissions_saved(),
-            soln_pds_new_iunits_reqd=self.ua.soln_pds_new_iunits_reqd(),
-            soln_ref_new_iunits_reqd=self.ua.soln_ref_new_iunits_reqd(),
-            conv_ref_new_iunits=self.ua.conv_ref_new_iunits(),
-            conv_ref_grid_CO2_per_KWh=self.ef.conv_ref_grid_CO2_per_KWh(),
-            conv_ref_grid_CO2eq_per_KWh=self.ef.conv_ref_grid_CO2eq_per_KWh(),
-            soln_net_annual_funits_adopted=soln_net_annual_funits_adopted,
-            fuel_in_liters=False)
-
-        self.r2s = rrs.RRS(total_energy_demand=ref_tam_per_region.loc[2014, 'World'],
-            soln_avg_annual_use=self.ac.soln_avg_annual_use,
-            conv_avg_annual_use=self.ac.conv_avg_annual_use)
+        self._fc = None
+        self._oc = None
+        self._c4 = None
+        self._c2 = None
+        self._r2s = None
+
+    # Only the adoption sources selected by soln_pds_adoption_basis and
+    # soln_ref_adoption_basis are needed by __init__, so each is built when first used.
+
+    @property
+    def ad(self):
+        if self._ad is None:
+            adconfig = {'World': {'trend': self.ac.soln_pds_adoption_prognostication_trend,
+                'growth': self.ac.soln_pds_adoption_prognostication_growth,
+                'low_sd_mult': 1.0, 'high_sd_mult': 1.0}, **_ADCONFIG_REGIONAL}
+            self._ad = adoptiondata.AdoptionData(ac=self.ac, data_sources=ad_data_sources,
+                adconfig=adconfig)
+        return self._ad
+
+    @property
+    def pds_ca(self):
+        if self._pds_ca is None:
+            self._pds_ca = customadoption.CustomAdoption(data_sources=ca_pds_data_sources,
+                soln_adoption_custom_name=self.ac.soln_pds_adoption_custom_name,
+                high_sd_mult=1.0, low_sd_mult=1.0,
+                total_adoption_limit=self.tm.pds_tam_per_region())
+        return self._pds_ca
+
+    @property
+    def ref_ca(self):
+        if self._ref_ca is None:
+            self._ref_ca = customadoption.CustomAdoption(data_sources=ca_ref_data_sources,
+                soln_adoption_custom_name=self.ac.soln_ref_adoption_custom_name,
+                high_sd_mult=1.0, low_sd_mult=1.0,
+                total_adoption_limit=self.tm.ref_tam_per_region())
+        return self._ref_ca
+
+    # The cost and emissions models below are only built when first used.
+
+    @property
+    def fc(self):
+        if self._fc is None:
+            self._fc = firstcost.FirstCost(ac=self.ac, pds_learning_increase_mult=2,
+                ref_learning_increase_mult=2, conv_learning_increase_mult=2,
+                soln_pds_tot_iunits_reqd=self.ua.soln_pds_tot_iunits_reqd(),
+                soln_ref_tot_iunits_reqd=self.ua.soln_ref_tot_iunits_reqd(),
+                conv_ref_tot_iunits=self.ua.conv_ref_tot_iunits(),
+                soln_pds_new_iunits_reqd=self.ua.soln_pds_new_iunits_reqd(),
+                soln_ref_new_iunits_reqd=self.ua.soln_ref_new_iunits_reqd(),
+                conv_ref_new_iunits=self.ua.conv_ref_new_iunits(),
+                fc_convert_iunit_factor=rrs.TERAWATT_TO_KILOWATT)
+        return self._fc
+
+    @property
+    def oc(self):
+        if self._oc is None:
+            self._oc = operatingcost.OperatingCost(ac=self.ac,
+                soln_net_annual_funits_adopted=self.ua.soln_net_annual_funits_adopted(),
+                soln_pds_tot_iunits_reqd=self.ua.soln_pds_tot_iunits_reqd(),
+                soln_ref_tot_iunits_reqd=self.ua.soln_ref_tot_iunits_reqd(),
+                conv_ref_annual_tot_iunits=self.ua.conv_ref_annual_tot_iunits(),
+                soln_pds_annual_world_first_cost=self.fc.soln_pds_annual_world_first_cost(),
+                soln_ref_annual_world_first_cost=self.fc.soln_ref_annual_world_first_cost(),
+                conv_ref_annual_world_first_cost=self.fc.conv_ref_annual_world_first_cost(),
+                single_iunit_purchase_year=2017,
+                soln_pds_install_cost_per_iunit=self.fc.soln_pds_install_cost_per_iunit(),
+                conv_ref_install_cost_per_iunit=self.fc.conv_ref_install_cost_per_iunit(),
+                conversion_factor=rrs.TERAWATT_TO_KILOWATT)
+        return self._oc
+
+    @property
+    def c4(self):
+        if self._c4 is None:
+            self._c4 = ch4calcs.CH4Calcs(ac=self.ac,
+                soln_net_annual_funits_adopted=self.ua.soln_net_annual_funits_adopted())
+        return self._c4
+
+    @property
+    def c2(self):
+        if self._c2 is None:
+            self._c2 = co2calcs.CO2Calcs(ac=self.ac,
+                ch4_ppb_calculator=self.c4.ch4_ppb_calculator(),
+                soln_pds_net_grid_electricity_units_saved=self.ua.soln_pds_net_grid_electricity_units_saved(),
+                soln_pds_net_grid_electricity_units_used=self.ua.soln_pds_net_grid_electricity_units_used(),
+                soln_pds_direct_co2_emissions_saved=self.ua.soln_pds_direct_co2_emissions_saved(),
+                soln_pds_direct_ch4_co2_emissions_saved=self.ua.soln_pds_direct_ch4_co2_emissions_saved(),
+                soln_pds_direct_n2o_co2_emissions_saved=self.ua.soln_pds_direct_n2o_co2_emissions_saved(),
+                soln_pds_new_iunits_reqd=self.ua.soln_pds_new_iunits_reqd(),
+                soln_ref_new_iunits_reqd=self.ua.soln_ref_new_iunits_reqd(),
+                conv_ref_new_iunits=self.ua.conv_ref_new_iunits(),
+                conv_ref_grid_CO2_per_KWh=self.ef.conv_ref_grid_CO2_per_KWh(),
+                conv_ref_grid_CO2eq_per_KWh=self.ef.conv_ref_grid_CO2eq_per_KWh(),
+                soln_net_annual_funits_adopted=self.ua.soln_net_annual_funits_adopted(),
+                fuel_in_liters=False)
+        return self._c2
+
+    @property
+    def r2s(self):
+        if self._r2s is None:
+            self._r2s = rrs.RRS(total_energy_demand=self.tm.ref_tam_per_region().loc[2014, 'World'],
+                soln_avg_annual_use=self.ac.soln_avg_annual_use,
+                conv_avg_annual_use=self.ac.conv_avg_annual_use)
+        return self._r2s
+
+
+def get_scenario(scenario=None):
+    """Return a Scenario shared by all callers asking for the same scenario name.
+
+       None means the default scenario, as for Scenario. The returned object must be
+       treated as read-only; construct Scenario directly to get a private instance.
+    """
+    if scenario is None:
+        scenario = list(scenarios.keys())[0]
+    return _get_scenario(scenario)
+
 
+@functools.lru_cache(maxsize=None)
+def _get_scenario(scenario):
+    return Scenario(scenario=scenario)
@@ -58,6 +58,33 @@ energy_tam_1_pds_data_sources = {
             'data', 'energy', 'PDS_optimum_scenario_1.csv')),
     },
 }
+# Every region draws from the same set of TAM sources, so the regional entries of
+# energy_tam_2_ref_data_sources all refer to this one dict.
+_energy_tam_2_regional_ref_data_sources = {
+    'Baseline Cases': {
+        'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
+        'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
+        'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
+        'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
+    },
+    'Conservative Cases': {
+        'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
+        'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
+        'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
+        'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
+        'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
+    },
+    'Ambitious Cases': {
+        'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
+        'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
+        'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
+        'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
+        'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
+    },
+    '100% RES2050 Case': {
+        'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
+    },
+}
 energy_tam_2_ref_data_sources = {
     'Baseline Cases': {
         'Based on IEA, WEO-2018, Current Policies Scenario (CPS)': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_WEO2018_Current_Policies_Scenario_CPS.csv'),
@@ -80,231 +107,15 @@ energy_tam_2_ref_data_sources = {
     '100% RES2050 Case': {
         'Based on average of: LUT/EWG 2019 100% RES, Ecofys 2018 1.5C and Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_average_of_LUTEWG_2019_100_RES_Ecofys_2018_1_5C_and_Greenpeace_2015_Advanced_Revolution.csv'),
     },
-    'Region: OECD90': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: Eastern Europe': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: Asia (Sans Japan)': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: Middle East and Africa': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: Latin America': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: China': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: India': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: EU': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
-    'Region: USA': {
-        'Baseline Cases': {
-            'Based on: IEA ETP 2016 6DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_6DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_Reference.csv'),
-            'Based on: AMPERE 2014 GEM E3 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_Reference.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_Reference.csv'),
-        },
-        'Conservative Cases': {
-            'Based on: IEA ETP 2016 4DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_4DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_550.csv'),
-            'Based on: AMPERE 2014 GEM E3 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_550.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 550': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_550.csv'),
-            'Based on: Greenpeace 2015 Reference': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Reference.csv'),
-        },
-        'Ambitious Cases': {
-            'Based on: IEA ETP 2016 2DS': parentdir.joinpath('data', 'energy', 'tam_based_on_IEA_ETP_2016_2DS.csv'),
-            'Based on: AMPERE 2014 MESSAGE MACRO 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_MESSAGE_MACRO_450.csv'),
-            'Based on: AMPERE 2014 GEM E3 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_GEM_E3_450.csv'),
-            'Based on: AMPERE 2014 IMAGE TIMER 450': parentdir.joinpath('data', 'energy', 'tam_based_on_AMPERE_2014_IMAGE_TIMER_450.csv'),
-            'Based on: Greenpeace 2015 Energy Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Energy_Revolution.csv'),
-        },
-        '100% RES2050 Case': {
-            'Based on: Greenpeace 2015 Advanced Revolution': parentdir.joinpath('data', 'energy', 'tam_based_on_Greenpeace_2015_Advanced_Revolution.csv'),
-        },
-    },
+    'Region: OECD90': _energy_tam_2_regional_ref_data_sources,
+    'Region: Eastern Europe': _energy_tam_2_regional_ref_data_sources,
+    'Region: Asia (Sans Japan)': _energy_tam_2_regional_ref_data_sources,
+    'Region: Middle East and Africa': _energy_tam_2_regional_ref_data_sources,
+    'Region: Latin America': _energy_tam_2_regional_ref_data_sources,
+    'Region: China': _energy_tam_2_regional_ref_data_sources,
+    'Region: India': _energy_tam_2_regional_ref_data_sources,
+    'Region: EU': _energy_tam_2_regional_ref_data_sources,
+    'Region: USA': _energy_tam_2_regional_ref_data_sources,
 }
 energy_tam_2_pds_data_sources = {
     'Ambitious Cases': {
@@ -0,0 +1,61 @@
+"""Tests for the Nuclear solution."""
+
+import sys
+
+from model import co2calcs
+from model import customadoption
+from model import firstcost
+from solution import nuclear
+
+
+def _record_constructions(monkeypatch, module, name):
+    """Replace module.name with a wrapper recording each construction."""
+    calls = []
+    cls = getattr(module, name)
+    def construct(*args, **kwargs):
+        calls.append(kwargs)
+        return cls(*args, **kwargs)
+    monkeypatch.setattr(module, name, construct)
+    return calls
+
+
+def test_get_scenario_is_shared():
+    scenario = list(nuclear.scenarios.keys())[1]
+    obj = nuclear.get_scenario(scenario)
+    assert obj.scenario == scenario
+    assert nuclear.get_scenario(scenario) is obj
+    assert nuclear.Scenario(scenario=scenario) is not obj
+    assert nuclear.get_scenario() is nuclear.get_scenario(list(nuclear.scenarios.keys())[0])
+
+
+def test_ad_data_source_names_are_interned():
+    oecd90 = nuclear.ad_data_sources['Region: OECD90']['Baseline Cases']
+    china = nuclear.ad_data_sources['Region: China']['Baseline Cases']
+    name = sys.intern('Based on: AMPERE 2014 MESSAGE MACRO Reference')
+    assert [k for k in oecd90 if k == name][0] is name
+    assert [k for k in china if k == name][0] is name
+
+
+def test_cost_and_emissions_models_built_on_first_use(monkeypatch):
+    fc_calls = _record_constructions(monkeypatch, firstcost, 'FirstCost')
+    c2_calls = _record_constructions(monkeypatch, co2calcs, 'CO2Calcs')
+    obj = nuclear.Scenario()
+    assert fc_calls == [] and c2_calls == []
+    c2 = obj.c2
+    assert c2.co2_mmt_reduced().loc[2050, 'World'] > 0.0
+    assert obj.c2 is c2
+    assert len(c2_calls) == 1
+    assert fc_calls == []
+    assert obj.fc is obj.fc
+    assert len(fc_calls) == 1
+
+
+def test_unselected_adoption_sources_built_on_first_use(monkeypatch):
+    ca_calls = _record_constructions(monkeypatch, customadoption, 'CustomAdoption')
+    obj = nuclear.Scenario()
+    assert obj.ac.soln_pds_adoption_basis == 'Existing Adoption Prognostications'
+    assert obj.ac.soln_ref_adoption_basis != 'Custom'
+    assert ca_calls == []
+    pds_ca = obj.pds_ca
+    assert obj.pds_ca is pds_ca
+    assert [c['data_sources'] for c in ca_calls] == [nuclear.ca_pds_data_sources]